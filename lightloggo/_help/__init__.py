@@ -1,8 +1,56 @@
+import functools
+import threading
+
+try:
+    import orjson
+except ImportError:  # опциональная зависимость (extra "perf")
+    orjson = None  # type: ignore[assignment]
+
+_SCALARS = (str, int, float, bool, type(None))
+
+# аккумулятор на поток: список переживает вызовы и сохраняет capacity,
+# вместо аллокации нового списка на каждую сериализацию
+_tls = threading.local()
+
+
+@functools.lru_cache(maxsize=2048)
+def _key_bytes(k: str) -> bytes:
+    # имена полей — маленький повторяющийся набор ("scope", "tb",
+    # kwargs-ключи): кэш превращает encode в dict lookup
+    return k.encode("utf-8")
+
+
+def _value_bytes(v: object) -> bytes:
+    # точные проверки типов первыми: str/int/float покрывают почти все
+    # значения полей, isinstance-цепочка остаётся медленным фолбэком
+    t = type(v)
+    if t is str:
+        return v.encode("utf-8")
+    if t is int or t is float or t is bool or v is None:
+        return str(v).encode("utf-8")
+    if isinstance(v, _SCALARS):
+        return str(v).encode("utf-8")
+    if orjson is not None:
+        # orjson сразу возвращает bytes — без str() + .encode()
+        try:
+            return orjson.dumps(v, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return str(v).encode("utf-8")
+
+
 def _serialize_fields(fields: dict) -> bytes:
-    buf = bytearray()
+    # одна C-level склейка вместо 4N мелких extend/append:
+    # join заранее считает итоговый размер и аллоцирует один раз
+    parts = getattr(_tls, "parts", None)
+    if parts is None:
+        parts = _tls.parts = []
+    else:
+        del parts[:]  # capacity сохраняется
+    ap = parts.append
     for k, v in fields.items():
-        buf.extend(str(k).encode("utf-8"))
-        buf.append(0)  # разделитель
-        buf.extend(str(v).encode("utf-8"))
-        buf.append(0)
-    return bytes(buf)
+        ap(_key_bytes(k) if type(k) is str else str(k).encode("utf-8"))
+        ap(_value_bytes(v))
+    if not parts:
+        return b""
+    return b"\x00".join(parts) + b"\x00"
@@ -1,19 +1,25 @@
-from .writer import CFileWriter, CStdoutWriter, CWriter
-from .style import CFormatStyle, CStyle
-from .format import CJsonFormatter, CTextFormatter, CFormatter
-from .route import CRouteProcessor, CRouter
+from typing import TYPE_CHECKING
+
+from .format import CJsonFormatter, CTextFormatter
 from .logger import CLogger
+from .route import CRouteProcessor
+from .style import CFormatStyle
+from .writer import CFileWriter, CStdoutWriter
+
+if TYPE_CHECKING:
+    from .format import CFormatter
+    from .route import CRouter
+    from .style import CStyle
+    from .writer import CWriter
 
+# Union-алиасы (CFormatter/CRouter/CStyle/CWriter) существуют только
+# для аннотаций под TYPE_CHECKING и в __all__ не входят
 __all__ = [
-    CFileWriter,
-    CStdoutWriter,
-    CFormatStyle,
-    CJsonFormatter,
-    CTextFormatter,
-    CFormatter,
-    CStyle,
-    CWriter,
-    CRouteProcessor,
-    CRouter,
-    CLogger,
+    "CFileWriter",
+    "CFormatStyle",
+    "CJsonFormatter",
+    "CLogger",
+    "CRouteProcessor",
+    "CStdoutWriter",
+    "CTextFormatter",
 ]
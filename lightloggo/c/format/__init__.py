@@ -1,5 +1,10 @@
+from typing import TYPE_CHECKING, Union
+
 from .json_formatter import CJsonFormatter
 from .text_formatter import CTextFormatter
-from typing import Union
 
-CFormatter = Union[CJsonFormatter, CTextFormatter]
+__all__ = ["CJsonFormatter", "CTextFormatter"]
+
+if TYPE_CHECKING:
+    # alias нужен только аннотациям — не строим typing.Union при импорте
+    CFormatter = Union[CJsonFormatter, CTextFormatter]
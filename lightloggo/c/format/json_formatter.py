@@ -1,6 +1,11 @@
 from ...ffi.ffi import lib
 
+# функция-символ привязана к имени модуля один раз — без lib.-lookup
+_new_json_formatter = lib.NewJsonFormatter
+
 
 class CJsonFormatter:
+    __slots__ = ("_id",)
+
     def __init__(self, style_id: int = 0, max_depth:int=3):
-        self._id = lib.NewJsonFormatter(style_id, max_depth)
+        self._id = _new_json_formatter(style_id, max_depth)
@@ -1,6 +1,11 @@
 from ...ffi.ffi import lib
 
+# функция-символ привязана к имени модуля один раз — без lib.-lookup
+_new_text_formatter = lib.NewTextFormatter
+
 
 class CTextFormatter:
+    __slots__ = ("_id",)
+
     def __init__(self, style_id: int = 0, max_depth:int=3):
-        self._id = lib.NewTextFormatter(style_id, max_depth)
+        self._id = _new_text_formatter(style_id, max_depth)
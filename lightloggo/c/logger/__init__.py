@@ -1,3 +1,3 @@
 from .base import CLogger
 
-__all__ = [CLogger]
+__all__ = ["CLogger"]
@@ -1,24 +1,54 @@
 from __future__ import annotations
 
-import contextlib
 import ctypes
+import functools
+from array import array
 from typing import List
 
-from ...ffi.ffi import lib
+from ...ffi.ffi import ID_T, lib
+
+# typecode с размером элемента, совпадающим с ID_T (c_size_t платформы)
+_ID_TYPECODE = "Q" if ctypes.sizeof(ID_T) == 8 else "L"
+
+
+@functools.lru_cache(maxsize=32)
+def _arr_type(n: int) -> type:
+    # ctypes создаёт новый class object на каждый `ID_T * n` —
+    # кэш по длине отдаёт готовый тип
+    return ID_T * n
 
 
 class CLogger:
+    __slots__ = ("_id",)
+
     def __init__(self, routes: List[int]) -> None:
-        arr_type = ctypes.c_ulong * len(routes)
-        route_ids = arr_type(*routes)
-        self._id = lib.NewLoggerWithRoutes(route_ids, len(routes))
+        # array.array пакует id в C-буфер одним C-циклом, from_buffer
+        # отдаёт его в Go без копии; Go копирует ids синхронно внутри
+        # вызова, так что локальной ссылки arr достаточно
+        n = len(routes)
+        arr = array(_ID_TYPECODE, routes)
+        buf = _arr_type(n).from_buffer(arr) if n else _arr_type(0)()
+        self._id = lib.NewLoggerWithRoutes(buf, n)
+
+    def flush(self) -> None:
+        if self._id:
+            lib.Logger_Flush(self._id)
 
     def close(self) -> None:
         if self._id:
-            lib.Logger_Close(self._id)
-            lib.FreeLogger(self._id)
+            lib.Logger_Shutdown(self._id)
             self._id = 0  # защитное обнуление
 
+    @classmethod
+    def from_ids_buffer(cls, buf) -> CLogger:
+        # zero-copy путь: array.array("L", ...)/memoryview/bytearray с
+        # уже уложенными id уходит в Go без поэлементного копирования
+        n = len(buf)
+        arr = _arr_type(n).from_buffer(buf) if n else _arr_type(0)()
+        obj = cls.__new__(cls)
+        obj._id = lib.NewLoggerWithRoutes(arr, n)
+        return obj
+
     @classmethod
     def from_id(cls, id_: int) -> CLogger:
         obj = cls.__new__(cls)
@@ -26,5 +56,7 @@ class CLogger:
         return obj
 
     def __del__(self) ->  None:
-        with contextlib.suppress(Exception):
+        try:  # noqa: SIM105 - suppress() — лишний контекст-менеджер в финализаторе
             self.close()
+        except Exception:  # noqa: S110
+            pass
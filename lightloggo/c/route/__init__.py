@@ -1,4 +1,9 @@
+from typing import TYPE_CHECKING, Union
+
 from .base import CRouteProcessor
-from typing import Union
 
-CRouter = Union[CRouteProcessor]
+__all__ = ["CRouteProcessor"]
+
+if TYPE_CHECKING:
+    # alias нужен только аннотациям — не строим typing.Union при импорте
+    CRouter = Union[CRouteProcessor]
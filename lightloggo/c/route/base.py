@@ -1,9 +1,17 @@
 from ...ffi.ffi import lib
 from ...enums import LogLevel
 
+# функция-символ привязана к имени модуля один раз — без lib.-lookup
+_new_route_processor = lib.NewRouteProcessor
+
 
 class CRouteProcessor:
+    __slots__ = ("_id",)
+
     def __init__(
         self, formatter_id: int, writer_id: int, level: LogLevel = 20
     ):  # default INFO
-        self._id = lib.NewRouteProcessor(formatter_id, writer_id, level)
+        # примитивный int вместо IntEnum — без __int__-диспатча в ctypes
+        if not isinstance(level, int) or isinstance(level, LogLevel):
+            level = int(level)
+        self._id = _new_route_processor(formatter_id, writer_id, level)
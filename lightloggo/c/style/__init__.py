@@ -1,4 +1,9 @@
+from typing import TYPE_CHECKING, Union
+
 from .base import CFormatStyle
-from typing import Union
 
-CStyle = Union[CFormatStyle]
+__all__ = ["CFormatStyle"]
+
+if TYPE_CHECKING:
+    # alias нужен только аннотациям — не строим typing.Union при импорте
+    CStyle = Union[CFormatStyle]
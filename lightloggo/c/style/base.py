@@ -1,21 +1,37 @@
+from typing import Union
+
 from ...ffi.ffi import lib
 
+# функция-символ привязана к имени модуля один раз — без lib.-lookup
+_new_format_style = lib.NewFormatStyle
+
+# дефолтные ANSI-коды закодированы один раз при импорте
+_DEFAULT_KEY = b"\033[34m"
+_DEFAULT_VALUE = b"\033[33m"
+_DEFAULT_RESET = b"\033[0m"
+
+
+def _color_bytes(color: Union[str, bytes]) -> bytes:
+    return color.encode() if isinstance(color, str) else color
+
 
 class CFormatStyle:
+    __slots__ = ("_id",)
+
     def __init__(
         self,
         color_keys=True,
         color_values=True,
         color_level=False,
-        key_color="\033[34m",
-        value_color="\033[33m",
-        reset="\033[0m",
+        key_color=_DEFAULT_KEY,
+        value_color=_DEFAULT_VALUE,
+        reset=_DEFAULT_RESET,
     ):
-        self._id = lib.NewFormatStyle(
+        self._id = _new_format_style(
             int(color_keys),
             int(color_values),
             int(color_level),
-            key_color.encode(),
-            value_color.encode(),
-            reset.encode(),
+            _color_bytes(key_color),
+            _color_bytes(value_color),
+            _color_bytes(reset),
         )
@@ -1,5 +1,10 @@
+from typing import TYPE_CHECKING, Union
+
 from .file_writer import CFileWriter
 from .stdout_writer import CStdoutWriter
-from typing import Union
 
-CWriter = Union[CFileWriter, CStdoutWriter]
+__all__ = ["CFileWriter", "CStdoutWriter"]
+
+if TYPE_CHECKING:
+    # alias нужен только аннотациям — не строим typing.Union при импорте
+    CWriter = Union[CFileWriter, CStdoutWriter]
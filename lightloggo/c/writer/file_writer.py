@@ -1,8 +1,18 @@
 from ...ffi.ffi import lib
-import ctypes
+
+# функция-символ привязана к имени модуля один раз — без lib.-lookup
+_new_file_writer = lib.NewFileWriter
+
+# конфиг-строки из конечного набора закодированы один раз при импорте;
+# эти же словари служат валидацией — неизвестное значение отсекается
+# до encode и FFI-вызова
+_INTERVAL_B = {"day": b"day", "week": b"week", "month": b"month", "": b""}
+_COMPRESS_B = {"gz": b"gz", "": b""}
 
 
 class CFileWriter:
+    __slots__ = ("_compress", "_id", "_interval", "_path")
+
     def __init__(
         self,
         path: str,
@@ -11,16 +21,23 @@ class CFileWriter:
         interval: str = "day",  # "day", "week", "month"
         compress: str = "gz",  # "gz" or ""
     ):
+        interval_b = _INTERVAL_B.get(interval)
+        if interval_b is None:
+            raise ValueError(f"unsupported rotate interval: {interval!r}")
+        compress_b = _COMPRESS_B.get(compress)
+        if compress_b is None:
+            raise ValueError(f"unsupported compression: {compress!r}")
         self._path = path.encode()
-        self._interval = interval.encode()
-        self._compress = compress.encode()
+        self._interval = interval_b
+        self._compress = compress_b
 
-        self._id = lib.NewFileWriter(
-            ctypes.c_char_p(self._path),
-            ctypes.c_long(max_size_mb),
-            ctypes.c_int(max_backups),
-            ctypes.c_char_p(self._interval),
-            ctypes.c_char_p(self._compress),
+        # argtypes объявлены в ffi.py — ctypes приводит bytes/int сам
+        self._id = _new_file_writer(
+            self._path,
+            max_size_mb,
+            max_backups,
+            self._interval,
+            self._compress,
         )
 
         if not self._id:
@@ -1,6 +1,29 @@
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
 from ...ffi.ffi import lib
 
+# функция-символ привязана к имени модуля один раз — без lib.-lookup
+_new_stdout_writer = lib.NewStdoutWriter
+
+_instance_lock = threading.Lock()
+
 
 class CStdoutWriter:
-    def __init__(self):
-        self._id = lib.NewStdoutWriter()
+    __slots__ = ("_id",)
+
+    # stdout один — второй Go-side writer для него не нужен
+    _instance: Optional[CStdoutWriter] = None
+
+    def __new__(cls) -> CStdoutWriter:
+        inst = cls._instance
+        if inst is None:
+            with _instance_lock:
+                inst = cls._instance
+                if inst is None:
+                    inst = super().__new__(cls)
+                    inst._id = _new_stdout_writer()
+                    cls._instance = inst
+        return inst
@@ -1,8 +1,9 @@
+import sys
 from enum import IntEnum
 
-try:
+if sys.version_info >= (3, 11):
     from enum import StrEnum
-except ImportError:
+else:
     import enum
 
     class StrEnum(str, enum.Enum):
@@ -32,15 +33,19 @@ class LogLevel(IntEnum):
 
     @classmethod
     def _from_string(cls, level: Level) -> "LogLevel":
-        if level == Level.Trace:
-            return cls.Trace
-        elif level == Level.Debug:
-            return cls.Debug
-        elif level == Level.Info:
-            return cls.Info
-        elif level == Level.Warning:
-            return cls.Warning
-        elif level == Level.Error:
-            return cls.Error
-        elif level == Level.Exception:
-            return cls.Exception
+        return _STR_MAP[level]
+
+
+# прямой hash-probe по _value2member_map_ вместо Enum.__call__
+Level.from_str = Level._value2member_map_.__getitem__
+LogLevel.from_int = LogLevel._value2member_map_.__getitem__
+
+# один hash-probe вместо цепочки StrEnum-сравнений
+_STR_MAP = {
+    Level.Trace: LogLevel.Trace,
+    Level.Debug: LogLevel.Debug,
+    Level.Info: LogLevel.Info,
+    Level.Warning: LogLevel.Warning,
+    Level.Error: LogLevel.Error,
+    Level.Exception: LogLevel.Exception,
+}
@@ -1,19 +1,18 @@
 from __future__ import annotations
 
 import ctypes as C
+import functools
 import os
+import struct
 import sys
-from typing import Callable, Union
-
-try:
-    from typing import Literal
-except ImportError:
-    from typing_extensions import Literal  # type: ignore
+import threading
+from typing import Any, Union
 
 BytesLike = Union[bytes, bytearray, memoryview]
 StrOrBytesLike = Union[str, BytesLike]
 
 
+@functools.lru_cache(maxsize=1)
 def _lib_filename() -> str:
     # Windows: .dll, macOS: .dylib, Linux/Unix: .so
     if sys.platform.startswith("win"):
@@ -31,12 +30,19 @@ def _candidate_paths() -> list[str]:
 
 def _load_lib() -> C.CDLL:
     last_exc: Exception | None = None
-    for path in _candidate_paths():
+    # POSIX: RTLD_NOW резолвит все символы при загрузке (один раз),
+    # RTLD_LOCAL не засоряет глобальное пространство символов процесса
+    if sys.platform.startswith("win"):
+        mode = C.DEFAULT_MODE
+    else:
+        mode = os.RTLD_NOW | os.RTLD_LOCAL
+    paths = _candidate_paths()
+    for path in paths:
         try:
-            return C.CDLL(os.path.abspath(path))
+            return C.CDLL(os.path.abspath(path), mode=mode)
         except OSError as e:
             last_exc = e
-    tried = "\n  - ".join(_candidate_paths())
+    tried = "\n  - ".join(paths)
     raise OSError(
         "Failed to load the native loggo library for platform "
         f"{sys.platform!r}. Tried paths:\n  - {tried}\n"
@@ -45,6 +51,8 @@ def _load_lib() -> C.CDLL:
     )
 
 
+# CDLL (в отличие от PyDLL) отпускает GIL на время каждого вызова:
+# пока Go форматирует/пишет, остальные Python-потоки продолжают работать
 lib: C.CDLL = _load_lib()
 
 # uintptr_t на стороне C/Go → используем c_size_t
@@ -60,6 +68,17 @@ lib.NewLoggerWithRoutes.restype = ID_T
 lib.FreeLogger.argtypes = [ID_T]
 lib.FreeLogger.restype = None
 
+lib.Logger_Close.argtypes = [ID_T]
+lib.Logger_Close.restype = None
+
+# flush + освобождение одной FFI-транзакцией
+lib.Logger_Shutdown.argtypes = [ID_T]
+lib.Logger_Shutdown.restype = None
+
+# принудительный сброс буферов writer'ов без остановки логгера
+lib.Logger_Flush.argtypes = [ID_T]
+lib.Logger_Flush.restype = None
+
 lib.NewFormatStyle.argtypes = [
     C.c_int,
     C.c_int,
@@ -76,6 +95,10 @@ lib.NewTextFormatter.restype = ID_T
 lib.NewJsonFormatter.argtypes = [ID_T, C.c_int]
 lib.NewJsonFormatter.restype = ID_T
 
+# уровень на стороне Go — uintptr_t, как и id-шники
+lib.NewRouteProcessor.argtypes = [ID_T, ID_T, ID_T]
+lib.NewRouteProcessor.restype = ID_T
+
 lib.NewStdoutWriter.argtypes = []
 lib.NewStdoutWriter.restype = ID_T
 
@@ -89,43 +112,117 @@ lib.NewFileWriter.argtypes = [
 lib.NewFileWriter.restype = ID_T
 
 
-def _bind5(name: str) -> Callable[[int, bytes, int, bytes, int], None]:
-    fn = getattr(lib, name)
-    fn.argtypes = [ID_T, C.c_char_p, C.c_size_t, C.c_char_p, C.c_size_t]
-    fn.restype = None
-    return fn
+# единая точка входа для всех уровней: msg и fields упакованы в один
+# буфер, уровень передаётся числом — одна маршаллинг-операция меньше
+# и нет словарного lookup по имени метода
+lib.Logger_LogPacked.argtypes = [ID_T, C.c_int, C.c_char_p, C.c_size_t, C.c_size_t]
+lib.Logger_LogPacked.restype = None
+_log_packed = lib.Logger_LogPacked
 
+lib.Logger_LogBatch.argtypes = [ID_T, C.c_char_p, C.c_size_t, C.c_int]
+lib.Logger_LogBatch.restype = None
+_log_batch = lib.Logger_LogBatch
 
-LOG_FUNS = {
-    "trace": _bind5("Logger_Trace"),
-    "debug": _bind5("Logger_Debug"),
-    "info": _bind5("Logger_Info"),
-    "warning": _bind5("Logger_Warning"),
-    "error": _bind5("Logger_Error"),
-    "exception": _bind5("Logger_Exception"),
-}
+# заголовок записи батча: level, msg_len, payload_len (little-endian uint32);
+# скомпилированный Struct — без парсинга format-строки на каждую запись
+_BATCH_HEADER = struct.Struct("<III")
 
 
 # ---- утилиты ----
+@functools.lru_cache(maxsize=512)
+def _encode_interned(s: str) -> bytes:
+    # горячие лог-строки — литералы: кэш превращает encode в dict lookup
+    return s.encode("utf-8")
+
+
 def _as_bytes(x: StrOrBytesLike) -> bytes:
-    return (
-        x
-        if isinstance(x, (bytes, bytearray))
-        else memoryview(x.encode("utf-8")).tobytes()
-    )
+    # type() is вместо isinstance — без обхода MRO на hot path
+    t = type(x)
+    if t is bytes:
+        return x
+    if t is str:
+        return x.encode("utf-8")
+    return bytes(x)  # bytearray / memoryview
+
+
+# переиспользуемый буфер на поток: мелкие записи копируются в него
+# вместо аллокации нового bytes на каждый вызов; Go копирует данные
+# синхронно (GoBytes), поэтому переиспользование безопасно
+_CALL_BUF_CAP = 4096
+
+
+class _CallBuffer(threading.local):
+    def __init__(self) -> None:
+        self.data = bytearray(_CALL_BUF_CAP)
+        self.view = (C.c_char * _CALL_BUF_CAP).from_buffer(self.data)
+
+
+_call_buf = _CallBuffer()
 
 
 def log_call(
-    method: Literal["trace", "debug", "info", "warning", "error", "exception"],
+    level: int,
     logger_id: int,
     msg_b: bytes,
-    fields_b: bytes,
+    fields_b: BytesLike,
+    # локальные бинды: LOAD_FAST вместо LOAD_GLOBAL на каждый вызов
+    _packed: Any = _log_packed,
+    _buf: Any = _call_buf,
+    _cap: int = _CALL_BUF_CAP,
 ) -> None:
-    fn = LOG_FUNS[method]
-    fn(
-        ID_T(logger_id),
-        C.c_char_p(msg_b),
-        len(msg_b),
-        C.c_char_p(fields_b),
-        len(fields_b),
-    )
+    # argtypes уже объявлены выше — ctypes сам приводит bytes/int,
+    # без создания c_char_p/c_size_t объектов на каждый вызов
+    n_msg = len(msg_b)
+    total = n_msg + len(fields_b)
+    if total <= _cap:
+        _buf.data[:n_msg] = msg_b
+        _buf.data[n_msg:total] = fields_b
+        _packed(logger_id, level, _buf.view, n_msg, total)
+    else:
+        payload = msg_b + bytes(fields_b)
+        _packed(logger_id, level, payload, n_msg, total)
+
+
+# буфер сборки батча: растёт по необходимости и переиспользуется между
+# отправками — без промежуточных bytes на каждую запись
+class _BatchBuffer(threading.local):
+    def __init__(self) -> None:
+        self.cap = 64 * 1024
+        self.data = bytearray(self.cap)
+        self.view = (C.c_char * self.cap).from_buffer(self.data)
+
+    def grow(self, need: int) -> None:
+        cap = self.cap
+        while cap < need:
+            cap *= 2
+        self.cap = cap
+        self.data = bytearray(cap)
+        self.view = (C.c_char * cap).from_buffer(self.data)
+
+
+_batch_buf = _BatchBuffer()
+_HDR_SIZE = _BATCH_HEADER.size
+
+
+def log_batch(logger_id: int, records: list[tuple[int, bytes, BytesLike]]) -> None:
+    # одна FFI-транзакция на весь батч — стоимость ctypes амортизируется
+    buf = _batch_buf
+    total = 0
+    for _, msg_b, fields_b in records:
+        total += _HDR_SIZE + len(msg_b) + len(fields_b)
+    if total > buf.cap:
+        buf.grow(total)
+
+    data = buf.data
+    off = 0
+    for level, msg_b, fields_b in records:
+        n_msg = len(msg_b)
+        n_fld = len(fields_b)
+        _BATCH_HEADER.pack_into(data, off, level, n_msg, n_msg + n_fld)
+        off += _HDR_SIZE
+        data[off : off + n_msg] = msg_b
+        off += n_msg
+        data[off : off + n_fld] = fields_b
+        off += n_fld
+
+    _log_batch(logger_id, buf.view, total, len(records))
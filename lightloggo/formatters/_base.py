@@ -1,9 +1,13 @@
-from ..c import CFormatter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..c import CFormatter
 
 
 class formatter:
-    _c_formatter: CFormatter
+    # id кэшируется конструктором конкретного форматтера как обычный
+    # int-атрибут — без property-дескриптора и цепочки _c_formatter._id
+    __slots__ = ("_c_formatter", "id")
 
-    @property
-    def id(self) -> int:
-        return self._c_formatter._id
+    _c_formatter: "CFormatter"
+    id: int
@@ -1,47 +1,47 @@
-import contextlib
 import threading
-from typing import Any, List
+from typing import List
 
 from ..routers import RouteProcessor
-from .logger import _Logger, create_default_logger
+from .logger import _METHODS, _Logger, create_default_logger
 
 
 class Logger:
+    # слоты под лог-методы: при каждой замене логгера сюда кладутся
+    # связанные методы _Logger — вызов идёт напрямую, без прокси-кадра
+    # и повторного чтения self._logger
+    __slots__ = (
+        "_lock",
+        "_logger",
+        "debug",
+        "error",
+        "exception",
+        "info",
+        "trace",
+        "warning",
+    )
+
     def __init__(self) -> None:
         self._lock = threading.Lock()
-        self._logger = self._create_default_logger()
+        self._swap(self._create_default_logger())
 
     def _create_default_logger(self) -> _Logger:
         return create_default_logger()
 
-    def info(self, msg: str, **kwargs: Any) -> None:
-        self._logger.info(msg, **kwargs)
-
-    def debug(self, msg: str, **kwargs: Any) -> None:
-        self._logger.debug(msg, **kwargs)
-
-    def warning(self, msg: str, **kwargs: Any) -> None:
-        self._logger.warning(msg, **kwargs)
-
-    def error(self, msg: str, **kwargs: Any) -> None:
-        self._logger.error(msg, **kwargs)
-
-    def exception(self, msg: str, **kwargs: Any) -> None:
-        self._logger.exception(msg, **kwargs)
-
-    def trace(self, msg: str, **kwargs: Any) -> None:
-        self._logger.trace(msg, **kwargs)
+    def _swap(self, logger: _Logger) -> None:
+        self._logger = logger
+        for name, _ in _METHODS:
+            setattr(self, name, getattr(logger, name))
 
     def add(self, route: RouteProcessor) -> None:
         with self._lock:
             # пересоздаём logger с новым роутом
             self._logger.close()
-            self._logger = _Logger(routes=[route])
+            self._swap(_Logger(routes=[route]))
 
     def remove(self) -> None:
         with self._lock:
             self._logger.close()
-            self._logger = self._create_default_logger()
+            self._swap(self._create_default_logger())
 
     def configure(
         self,
@@ -50,21 +50,31 @@ class Logger:
         tb_max_depth: int = 10,
         tb_level: int = 50,
         scope: bool = True,
+        enqueue: bool = False,
     ) -> None:
         with self._lock:
             self._logger.close()
-            self._logger = _Logger(
-                routes=list(routes),
-                tb=tb,
-                tb_max_depth=tb_max_depth,
-                tb_level=tb_level,
-                scope=scope,
+            self._swap(
+                _Logger(
+                    routes=routes,
+                    tb=tb,
+                    tb_max_depth=tb_max_depth,
+                    tb_level=tb_level,
+                    scope=scope,
+                    enqueue=enqueue,
+                )
             )
 
+    def flush(self) -> None:
+        with self._lock:
+            self._logger.flush()
+
     def close(self) -> None:
         with self._lock:
             self._logger.close()
 
     def __del__(self) -> None:
-        with contextlib.suppress(Exception):
+        try:  # noqa: SIM105 - suppress() — лишний контекст-менеджер в финализаторе
             self._logger.close()
+        except Exception:  # noqa: S110
+            pass
@@ -1,22 +1,66 @@
-import contextlib
+import atexit
+import functools
 import linecache
-import os
+import queue
 import sys
-from typing import Any, Dict, List
-
-try:
-    from typing import Literal
-except ImportError:
-    from typing_extensions import Literal  # type: ignore
+import threading
+from typing import Any, Dict, List, Optional
 
 from .._help import _serialize_fields
 from ..c import CLogger
 from ..enums import LogLevel
-from ..ffi.ffi import _as_bytes, log_call
+from ..ffi.ffi import ID_T, _as_bytes, _encode_interned, log_batch, log_call
 from ..routers import RouteProcessor
 
+# максимум записей, отправляемых одной FFI-транзакцией в enqueue-режиме
+_BATCH_MAX = 256
+
+@functools.lru_cache(maxsize=512)
+def _basename(path: str) -> str:
+    # rpartition вместо os.path.basename: без platform-диспатча posixpath,
+    # плюс кэш — имя файла у code object не меняется
+    return path.rpartition("/")[2].rpartition("\\")[2]
+
+
+@functools.lru_cache(maxsize=1024)
+def _scope_for(code: Any, lineno: int) -> str:
+    # одни и те же call-site'ы повторяются из горячих циклов — кэш по
+    # (code object, lineno) платит за basename и f-string один раз
+    return f"{_basename(code.co_filename)}:{lineno} in {code.co_name}()"
+
+
+@functools.lru_cache(maxsize=4096)
+def _source_line(filename: str, lineno: int) -> str:
+    # строки исходников неизменны на время процесса: кэш платит за
+    # getlines, индексацию и strip один раз на (файл, строка)
+    src = linecache.getlines(filename)
+    return src[lineno - 1].strip() if 0 < lineno <= len(src) else ""
+
+
+# метод → числовой уровень, вычислено один раз на импорте
+_METHODS = (
+    ("trace", int(LogLevel.Trace)),
+    ("debug", int(LogLevel.Debug)),
+    ("info", int(LogLevel.Info)),
+    ("warning", int(LogLevel.Warning)),
+    ("error", int(LogLevel.Error)),
+    ("exception", int(LogLevel.Exception)),
+)
+
 
 class _Logger:
+    __slots__ = (
+        "_c_logger",
+        "_cid",
+        "_cid_c",
+        "_min_level",
+        "_queue",
+        "_resolve",
+        "_tb_level",
+        "_tb_max_depth",
+        "_worker",
+    )
+
     def __init__(
         self,
         routes: List[RouteProcessor],
@@ -24,110 +68,207 @@ class _Logger:
         tb_max_depth: int = 10,
         tb_level: int = 50,
         scope: bool = True,
+        enqueue: bool = False,
     ) -> None:
-        route_ids = [r.id for r in routes]
+        # один проход по роутам: id-шники и минимальный уровень сразу;
+        # отфильтрованные записи отбрасываем до кодирования/сериализации/FFI
+        route_ids = []
+        min_level = None
+        for r in routes:
+            route_ids.append(r.id)
+            if min_level is None or r.level < min_level:
+                min_level = r.level
         self._c_logger = CLogger(route_ids)
-        self._routes = routes
-        self._tb = tb
+        # id зафиксирован на время жизни — кэш вместо property-цепочки
+        # self._c_logger._id на каждом вызове; _cid_c — заранее
+        # упакованный ID_T: ctypes пропускает int→C конверсию
+        self._cid = self._c_logger._id
+        self._cid_c = ID_T(self._cid)
+        self._min_level = min_level if min_level is not None else 0
         self._tb_max_depth = tb_max_depth
-        self._scope = scope
         self._tb_level = tb_level
+        # конфигурация неизменна на время жизни логгера — ветвление по
+        # tb/scope разрешаем один раз здесь, а не на каждом вызове
+        if tb:
+            resolve = _resolve_tb_scope if scope else _resolve_tb
+        else:
+            resolve = _resolve_scope if scope else _resolve_plain
+        self._resolve = resolve.__get__(self, _Logger)
+        self._queue: Optional[queue.SimpleQueue] = None
+        self._worker: Optional[threading.Thread] = None
+        if enqueue:
+            self._queue = queue.SimpleQueue()
+            self._worker = threading.Thread(target=self._drain, daemon=True)
+            self._worker.start()
+            atexit.register(self.close)
 
     @property
     def id(self) -> int:
-        return self._c_logger._id
+        return self._cid
 
     def _log(
         self,
-        method: Literal["trace", "debug", "info", "warning", "error", "exception"],
+        level: int,
         msg: str,
-        **kwargs: Any,
+        fields: Dict[str, Any],
+        # локальные бинды: LOAD_FAST вместо LOAD_GLOBAL на каждый вызов
+        _encode: Any = _encode_interned,
+        _to_bytes: Any = _as_bytes,
+        _serialize: Any = _serialize_fields,
+        _send: Any = log_call,
     ) -> None:
-        if not msg and not kwargs:
+        if level < self._min_level:
+            return
+        if not msg and not fields:
             return
 
-        level = getattr(LogLevel, method.capitalize())
-        msg_b = _as_bytes(msg)
-        if not kwargs:
+        msg_b = _encode(msg) if type(msg) is str else _to_bytes(msg)
+        if self._queue is not None:
+            # hot path заканчивается на enqueue: сериализацию, упаковку и
+            # FFI делает воркер; resolve остаётся здесь — scope/tb читают
+            # стек вызывающего потока, а fields-словарём владеем мы
+            self._queue.put(
+                (level, msg_b, self._resolve(level, fields) if fields else None)
+            )
+            return
+        if not fields:
             fields_b = b"0"
         else:
-            fields_b = _serialize_fields(self._resolve_fields(level, kwargs))
-        log_call(method, self.id, msg_b, fields_b)
-
-    def _resolve_fields(
-        self,
-        level: LogLevel,
-        fields: Dict[str, Any],
-    ) -> Dict[str, Any]:
-        fields_cp = dict(fields)
-        tb = False
-        if self._tb and self._tb_level <= level:
-            fields_cp["tb"] = self._add_traceback(max_depth=self._tb_max_depth)
-            tb = True
-        if not tb and self._scope:
-            fields_cp["scope"] = self._add_scope()
+            fields_b = _serialize(self._resolve(level, fields))
+        _send(level, self._cid_c, msg_b, fields_b)
 
-        return fields_cp
+    def _drain(self, _serialize: Any = _serialize_fields) -> None:
+        q = self._queue
+        stop = False
+        while not stop:
+            item = q.get()
+            if item is None:
+                break
+            batch = [item]
+            while len(batch) < _BATCH_MAX:
+                try:
+                    nxt = q.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                batch.append(nxt)
+            if len(batch) == 1:
+                # одиночная запись: без batch-заголовка и Go-парсинга
+                level, msg_b, fields = batch[0]
+                fields_b = b"0" if fields is None else _serialize(fields)
+                log_call(level, self._cid_c, msg_b, fields_b)
+            else:
+                log_batch(
+                    self._cid_c,
+                    [
+                        (lvl, m, b"0" if f is None else _serialize(f))
+                        for lvl, m, f in batch
+                    ],
+                )
 
     @staticmethod
-    def _add_scope(frame_depth: int = 5) -> str:
+    def _add_scope(frame_depth: int = 4, _getframe: Any = sys._getframe) -> str:
         try:
-            frame = sys._getframe(frame_depth)
-            filename = os.path.basename(frame.f_code.co_filename)
-            lineno = frame.f_lineno
-            func = frame.f_code.co_name
-            return f"{filename}:{lineno} in {func}()"
+            frame = _getframe(frame_depth)
+            return _scope_for(frame.f_code, frame.f_lineno)
         except Exception:
             return "<scope unavailable>"
 
     @staticmethod
-    def _add_traceback(max_depth: int = 10, skip: int = 5) -> str:
+    def _add_traceback(
+        max_depth: int = 10,
+        skip: int = 4,
+        # локальные бинды: LOAD_FAST вместо LOAD_GLOBAL+LOAD_ATTR в цикле
+        _getframe: Any = sys._getframe,
+        _line: Any = _source_line,
+        _bn: Any = _basename,
+    ) -> str:
+        # первый проход собирает кадры, второй форматирует; текст строки
+        # берётся из _source_line — один hash lookup на (файл, строка)
+        entries = []
+        frame = _getframe(skip)
+        while frame is not None and len(entries) < max_depth:
+            code = frame.f_code
+            entries.append((code.co_filename, frame.f_lineno, code.co_name))
+            frame = frame.f_back
+
         lines = []
-        frame = sys._getframe(skip)
+        for filename_full, lineno, func in entries:
+            code_line = _line(filename_full, lineno)
+            filename = _bn(filename_full)
+            lines.append(
+                f'  File "{filename}", line {lineno}, in {func}()\n    {code_line}\n'
+            )
 
-        for _ in range(max_depth):
-            if frame is None:
-                break
+        return "".join(lines)
 
-            filename_full = frame.f_code.co_filename
-            filename = os.path.basename(filename_full)
-            lineno = frame.f_lineno
-            func = frame.f_code.co_name
+    def flush(self) -> None:
+        # сбрасывает буферы writer'ов на стороне Go; очередь enqueue-режима
+        # не дожидается — для полного дренажа есть close()
+        self._c_logger.flush()
 
-            code_line = linecache.getline(filename_full, lineno).strip()
+    def close(self) -> None:
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+            self._queue = None
+            atexit.unregister(self.close)
+        self._c_logger.close()
 
-            lines.append(
-                f'  File "{filename}", line {lineno}, in {func}()\n    {code_line}\n'
-            )
+    def __del__(self) -> None:
+        try:  # noqa: SIM105 - suppress() — лишний контекст-менеджер в финализаторе
+            self.close()
+        except Exception:  # noqa: S110
+            pass
 
-            frame = frame.f_back
 
-        return "".join(lines)
+# специализированные варианты _resolve: выбираются в __init__ по (tb, scope);
+# fields — свежий **kwargs-словарь, владеем им и мутируем на месте
+def _resolve_plain(
+    self: "_Logger", level: int, fields: Dict[str, Any]
+) -> Dict[str, Any]:
+    return fields
 
-    def trace(self, msg: str, **kwargs: Any) -> None:
-        self._log("trace", msg, **kwargs)
 
-    def debug(self, msg: str, **kwargs: Any) -> None:
-        self._log("debug", msg, **kwargs)
+def _resolve_scope(
+    self: "_Logger", level: int, fields: Dict[str, Any]
+) -> Dict[str, Any]:
+    fields["scope"] = self._add_scope()
+    return fields
 
-    def info(self, msg: str, **kwargs: Any) -> None:
-        self._log("info", msg, **kwargs)
 
-    def warning(self, msg: str, **kwargs: Any) -> None:
-        self._log("warning", msg, **kwargs)
+def _resolve_tb(self: "_Logger", level: int, fields: Dict[str, Any]) -> Dict[str, Any]:
+    if self._tb_level <= level:
+        fields["tb"] = self._add_traceback(max_depth=self._tb_max_depth)
+    return fields
 
-    def error(self, msg: str, **kwargs: Any) -> None:
-        self._log("error", msg, **kwargs)
 
-    def exception(self, msg: str, **kwargs: Any) -> None:
-        self._log("exception", msg, **kwargs)
+def _resolve_tb_scope(
+    self: "_Logger", level: int, fields: Dict[str, Any]
+) -> Dict[str, Any]:
+    if self._tb_level <= level:
+        fields["tb"] = self._add_traceback(max_depth=self._tb_max_depth)
+    else:
+        fields["scope"] = self._add_scope()
+    return fields
 
-    def close(self) -> None:
-        self._c_logger.close()
 
-    def __del__(self) -> None:
-        with contextlib.suppress(Exception):
-            self.close()
+def _make_level_method(name: str, level: int) -> Any:
+    # уровень «вшит» в замыкание — на вызове нет getattr/capitalize;
+    # kwargs уходит дальше одним словарём, без повторной распаковки
+    def _level_method(self: "_Logger", msg: str, **kwargs: Any) -> None:
+        self._log(level, msg, kwargs)
+
+    _level_method.__name__ = name
+    _level_method.__qualname__ = f"_Logger.{name}"
+    return _level_method
+
+
+for _name, _level in _METHODS:
+    setattr(_Logger, _name, _make_level_method(_name, _level))
 
 
 def create_default_logger() -> _Logger:
@@ -1,3 +1,6 @@
+import functools
+from typing import Optional
+
 from ..c import CRouteProcessor
 from ..enums import LogLevel
 from ..formatters import Formatter, TextFormatter
@@ -5,11 +8,32 @@ from ..writers import StdoutWriter, Writer
 from ._base import router
 
 
+# дефолты создаются лениво и один раз: без FFI-вызовов на импорте пакета
+# и без нового Go-ресурса на каждый роут с параметрами по умолчанию.
+# Дефолтные инстансы разделяются — кому нужна изоляция, передаёт свои.
+@functools.lru_cache(maxsize=None)
+def _default_formatter() -> TextFormatter:
+    return TextFormatter()
+
+
+@functools.lru_cache(maxsize=None)
+def _default_writer() -> StdoutWriter:
+    return StdoutWriter()
+
+
 class RouteProcessor(router):
+    __slots__ = ("level",)
+
     def __init__(
         self,
-        formatter: Formatter = TextFormatter(),
-        writer: Writer = StdoutWriter(),
+        formatter: Optional[Formatter] = None,
+        writer: Optional[Writer] = None,
         level: LogLevel = 20,
     ) -> None:  # default INFO
-        self._c_router = CRouteProcessor(formatter.id, writer.id, level)
+        if formatter is None:
+            formatter = _default_formatter()
+        if writer is None:
+            writer = _default_writer()
+        self.level = int(level)
+        self._c_router = CRouteProcessor(formatter.id, writer.id, self.level)
+        self.id = self._c_router._id
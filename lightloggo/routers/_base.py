@@ -1,9 +1,13 @@
-from ..c import CRouter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..c import CRouter
 
 
 class router:
-    _c_router: CRouter
+    # id кэшируется конструктором как обычный int-атрибут —
+    # без property-дескриптора и цепочки _c_router._id
+    __slots__ = ("_c_router", "id")
 
-    @property
-    def id(self) -> int:
-        return self._c_router._id
+    _c_router: "CRouter"
+    id: int
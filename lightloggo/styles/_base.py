@@ -1,17 +1,46 @@
-from ..c import CFormatStyle, CStyle
+from typing import TYPE_CHECKING, Union
+
+from ..c import CFormatStyle
+
+if TYPE_CHECKING:
+    from ..c import CStyle
+
+# ходовые ANSI-коды закодированы один раз при импорте: один и тот же
+# bytes-объект разделяется всеми стилями с одинаковыми цветами
+_ANSI_INTERN = {
+    s: s.encode()
+    for s in (
+        "\033[30m",
+        "\033[31m",
+        "\033[32m",
+        "\033[33m",
+        "\033[34m",
+        "\033[35m",
+        "\033[36m",
+        "\033[37m",
+        "\033[0m",
+    )
+}
+
+
+def _ansi_bytes(color: Union[str, bytes]) -> bytes:
+    if type(color) is bytes:
+        return color
+    return _ANSI_INTERN.get(color) or color.encode()
 
 
 class BaseStyle:
-    _c_style: CStyle
+    # id кэшируется конструктором как обычный int-атрибут — без
+    # property-дескриптора и hasattr-проверки на каждом обращении
+    __slots__ = ("_c_style", "id")
 
-    @property
-    def id(self) -> int:
-        if not hasattr(self, "_c_style"):
-            raise RuntimeError("C style not initialized")
-        return self._c_style._id
+    _c_style: "CStyle"
+    id: int
 
 
 class FormatStyle(BaseStyle):
+    __slots__ = ()
+
     def __init__(
         self,
         color_keys: bool = True,
@@ -25,7 +54,8 @@ class FormatStyle(BaseStyle):
             color_keys=color_keys,
             color_values=color_values,
             color_level=color_level,
-            key_color=key_color,
-            value_color=value_color,
-            reset=reset,
+            key_color=_ansi_bytes(key_color),
+            value_color=_ansi_bytes(value_color),
+            reset=_ansi_bytes(reset),
         )
+        self.id = self._c_style._id
@@ -1,6 +1,10 @@
 from typing import Union
 
+from ._base import writer
 from .file import FileWriter
 from .stdout import StdoutWriter
 
+# writer — общий базовый класс: рантайм-проверка это один
+# isinstance(x, writer) вместо обхода двухэлементного Union;
+# Union остаётся typing-алиасом для аннотаций
 Writer = Union[FileWriter, StdoutWriter]
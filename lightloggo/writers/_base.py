@@ -1,9 +1,13 @@
-from ..c import CWriter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..c import CWriter
 
 
 class writer:
-    _c_writer: CWriter
+    # id кэшируется конструктором как обычный int-атрибут —
+    # без property-дескриптора и цепочки _c_writer._id
+    __slots__ = ("_c_writer", "id")
 
-    @property
-    def id(self) -> int:
-        return self._c_writer._id
+    _c_writer: "CWriter"
+    id: int
@@ -3,6 +3,8 @@ from ._base import writer
 
 
 class FileWriter(writer):
+    __slots__ = ()
+
     def __init__(
         self,
         path: str,
@@ -18,3 +20,4 @@ class FileWriter(writer):
             interval=interval,
             compress=compress,
         )
+        self.id = self._c_writer._id
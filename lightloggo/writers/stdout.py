@@ -1,7 +1,29 @@
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
 from ..c import CStdoutWriter
 from ._base import writer
 
+_instance_lock = threading.Lock()
+
 
 class StdoutWriter(writer):
-    def __init__(self) -> None:
-        self._c_writer = CStdoutWriter()
+    __slots__ = ()
+
+    # stdout один — все вызовы получают один и тот же объект-обёртку,
+    # как и CStdoutWriter уровнем ниже
+    _instance: Optional[StdoutWriter] = None
+
+    def __new__(cls) -> StdoutWriter:
+        inst = cls._instance
+        if inst is None:
+            with _instance_lock:
+                inst = cls._instance
+                if inst is None:
+                    inst = super().__new__(cls)
+                    inst._c_writer = CStdoutWriter()
+                    inst.id = inst._c_writer._id
+                    cls._instance = inst
+        return inst
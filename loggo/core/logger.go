@@ -41,6 +41,15 @@ func (l *Logger) Close() {
 	l.wg.Wait()
 }
 
+// Flush принудительно сбрасывает буферы writer'ов всех маршрутов, не останавливая воркеры.
+func (l *Logger) Flush() {
+	for _, r := range l.RoutesSnapshot() {
+		if r != nil {
+			r.Flush()
+		}
+	}
+}
+
 func (l *Logger) RoutesSnapshot() []*RouteProcessor {
 	l.mu.RLock()
 	routes := append([]*RouteProcessor(nil), l.routes...)
@@ -106,6 +106,13 @@ func rawToRecord(rec LogRecordRaw) LogRecord {
 	}
 }
 
+// Flush сбрасывает буфер writer'а, не останавливая воркер и не трогая очередь.
+func (r *RouteProcessor) Flush() {
+	if f, ok := r.Writer.(FlushableWriter); ok {
+		_ = f.Flush()
+	}
+}
+
 // drainQueue считывает остатки очереди и вызывает Flush().
 func (r *RouteProcessor) drainQueue() {
 	for rec := range r.queue {
@@ -43,6 +43,9 @@ type FileWriter struct {
 
 	rotateInterval RotateInterval
 	nextRotateTime time.Time
+
+	done      chan struct{}
+	closeOnce sync.Once
 }
 
 // NewFileWriter создаёт новый лог-файл с опциями ротации и сжатия.
@@ -60,6 +63,8 @@ func NewFileWriter(path string, maxSizeMB int64, maxBackups int, interval Rotate
 		case Gz:
 			compressVal = "gz"
 			comp = &compressor.GzipCompressor{}
+		case Null:
+			// без компрессора: ротация просто переименовывает файл
 		// можно добавить другие варианты позже
 		default:
 			return nil, fmt.Errorf("unsupported compression: %s", *compress)
@@ -78,18 +83,43 @@ func NewFileWriter(path string, maxSizeMB int64, maxBackups int, interval Rotate
 	}
 
 	now := time.Now()
-	return &FileWriter{
+	fw := &FileWriter{
 		path:           path,
 		maxSizeMB:      maxSizeMB,
 		maxBackups:     maxBackups,
 		compress:       Compress(compressVal),
 		compressor:     comp,
 		file:           f,
-		writer:         bufio.NewWriter(f),
+		writer:         bufio.NewWriterSize(f, writeBufSize),
 		size:           info.Size(),
 		rotateInterval: interval,
 		nextRotateTime: nextRotation(now, interval),
-	}, nil
+		done:           make(chan struct{}),
+	}
+	go fw.flushLoop(fw.done)
+	return fw, nil
+}
+
+// Размер буфера записи: крупный буфер батчит много записей в один syscall.
+const writeBufSize = 64 * 1024
+
+// Интервал фонового сброса: при редком логировании записи не задерживаются
+// в буфере дольше этого времени.
+const flushInterval = time.Second
+
+// flushLoop периодически сбрасывает буфер; останавливается в Close().
+// Канал передаётся параметром, чтобы не читать поле без блокировки.
+func (fw *FileWriter) flushLoop(done <-chan struct{}) {
+	ticker := time.NewTicker(flushInterval)
+	defer ticker.Stop()
+	for {
+		select {
+		case <-ticker.C:
+			_ = fw.Flush()
+		case <-done:
+			return
+		}
+	}
 }
 
 func (fw *FileWriter) Write(p []byte) error {
@@ -102,9 +132,17 @@ func (fw *FileWriter) Write(p []byte) error {
 		}
 	}
 
-	n, err := fw.writer.Write(append(p, '\n'))
+	// запись + перевод строки отдельно — без append-копии p на каждый вызов
+	n, err := fw.writer.Write(p)
 	fw.size += int64(n)
-	return err
+	if err != nil {
+		return err
+	}
+	if err := fw.writer.WriteByte('\n'); err != nil {
+		return err
+	}
+	fw.size++
+	return nil
 }
 
 func (fw *FileWriter) Flush() error {
@@ -114,6 +152,7 @@ func (fw *FileWriter) Flush() error {
 }
 
 func (fw *FileWriter) Close() error {
+	fw.closeOnce.Do(func() { close(fw.done) })
 	fw.mu.Lock()
 	defer fw.mu.Unlock()
 	_ = fw.writer.Flush()
@@ -173,7 +212,7 @@ func (fw *FileWriter) rotate() error {
 		return err
 	}
 	fw.file = f
-	fw.writer = bufio.NewWriter(f)
+	fw.writer = bufio.NewWriterSize(f, writeBufSize)
 	fw.size = 0
 
 	fw.cleanupBackups()
@@ -7,6 +7,7 @@ package main
 import "C"
 
 import (
+	"encoding/binary"
 	"funchooooza-ossh/loggo/core"
 	"funchooooza-ossh/loggo/core/formatter"
 	"funchooooza-ossh/loggo/core/writer"
@@ -227,6 +228,86 @@ func Logger_Exception(loggerId C.uintptr_t, msg *C.char, msgLen C.size_t,
 	LogN(loggerId, core.Exception, msg, msgLen, fields, fieldsLen)
 }
 
+//export Logger_LogPacked
+func Logger_LogPacked(loggerId C.uintptr_t, level C.int,
+	data *C.char, msgLen C.size_t, totalLen C.size_t) {
+	storeMu.Lock()
+	lg := loggerStore[uintptr(loggerId)]
+	storeMu.Unlock()
+	if lg == nil || msgLen > totalLen {
+		return
+	}
+
+	lvl := core.LogLevel(level)
+	if !lg.AnyRouteShouldLog(lvl) {
+		return
+	}
+	rts := lg.RoutesSnapshot()
+
+	var buf []byte
+	if data != nil && totalLen > 0 {
+		buf = C.GoBytes(unsafe.Pointer(data), C.int(totalLen))
+	}
+
+	record := core.LogRecordRaw{
+		Level:   lvl,
+		Message: buf[:msgLen],
+		Fields:  buf[msgLen:],
+	}
+
+	for _, r := range rts {
+		if r != nil && r.ShouldLog(lvl) {
+			r.Enqueue(record)
+		}
+	}
+}
+
+// Формат записи батча: 12-байтовый заголовок (level, msgLen, payloadLen —
+// little-endian uint32) + payload (msg и fields подряд).
+const batchHeaderSize = 12
+
+//export Logger_LogBatch
+func Logger_LogBatch(loggerId C.uintptr_t, data *C.char, totalLen C.size_t, count C.int) {
+	storeMu.Lock()
+	lg := loggerStore[uintptr(loggerId)]
+	storeMu.Unlock()
+	if lg == nil || data == nil || totalLen == 0 {
+		return
+	}
+
+	buf := C.GoBytes(unsafe.Pointer(data), C.int(totalLen))
+	rts := lg.RoutesSnapshot()
+
+	off := 0
+	for i := 0; i < int(count); i++ {
+		if off+batchHeaderSize > len(buf) {
+			return
+		}
+		level := core.LogLevel(binary.LittleEndian.Uint32(buf[off:]))
+		msgLen := int(binary.LittleEndian.Uint32(buf[off+4:]))
+		payloadLen := int(binary.LittleEndian.Uint32(buf[off+8:]))
+		off += batchHeaderSize
+
+		if msgLen > payloadLen || off+payloadLen > len(buf) {
+			return
+		}
+		payload := buf[off : off+payloadLen]
+		off += payloadLen
+
+		record := core.LogRecordRaw{
+			Level:   level,
+			Message: payload[:msgLen],
+			Fields:  payload[msgLen:],
+		}
+
+		for _, r := range rts {
+			if r != nil && r.ShouldLog(level) {
+				r.Enqueue(record)
+			}
+		}
+	}
+}
+
 //export FreeLogger
 func FreeLogger(loggerID C.uintptr_t) {
 	storeMu.Lock()
@@ -243,4 +324,27 @@ func Logger_Close(loggerID C.uintptr_t) {
 	logger.Close()
 }
 
+//export Logger_Flush
+func Logger_Flush(loggerID C.uintptr_t) {
+	storeMu.Lock()
+	logger := loggerStore[uintptr(loggerID)]
+	storeMu.Unlock()
+
+	if logger != nil {
+		logger.Flush()
+	}
+}
+
+//export Logger_Shutdown
+func Logger_Shutdown(loggerID C.uintptr_t) {
+	storeMu.Lock()
+	logger := loggerStore[uintptr(loggerID)]
+	delete(loggerStore, uintptr(loggerID))
+	storeMu.Unlock()
+
+	if logger != nil {
+		logger.Close()
+	}
+}
+
 func main() {}